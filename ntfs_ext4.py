@@ -18,17 +18,29 @@ TOP 10 FAILURE MODES ADDRESSED:
 """
 import os
 import sys
+import stat
+import errno
+import fcntl
 import subprocess
 import threading
 import time
 import tempfile
 import shutil
 import resource
+import atexit
+import codecs
+import selectors
+import itertools
+import ctypes
+import traceback
 from datetime import datetime
-from collections import defaultdict
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext
 import tkinter.ttk as ttk
+try: import scandir_rs  # optional: Rust directory walker for the pre-copy scan
+except ImportError: scandir_rs = None
 
 # ============================================================================
 # CONFIGURATION CONSTANTS
@@ -42,13 +54,45 @@ MAX_FILE_SCAN_MEMORY_MB = 500
 THREAD_TIMEOUT_SECONDS = 30
 RETRY_ATTEMPTS = 3
 RETRY_DELAY_SECONDS = 2
+SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+CASE_CONFLICT_MAX = 1000
+RSYNC_WORKERS = 4
+BUCKET_MAX_BYTES = 1 << 30
+BUCKET_MAX_FILES = 1000
+COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+FAST_COPY_CHUNK = 64 << 20  # per copy call; also the sync_file_range writeback window
+FALLBACK_BUFFER = 1 << 20
+WILLNEED_MAX_BYTES = 64 << 20
+O_NOATIME = getattr(os, 'O_NOATIME', 0)
+SYNC_FILE_RANGE_WRITE, SYNC_FILE_RANGE_WAIT = 2, 1 | 2 | 4  # WRITE; WAIT_BEFORE|WRITE|WAIT_AFTER
+FICLONE = getattr(fcntl, 'FICLONE', 0x40049409)
+REFLINK_FS = frozenset({'btrfs', 'xfs', 'bcachefs', 'zfs', 'ocfs2'})
+VERIFY_WORKERS = 8
+FILE_MODE, DIR_MODE = 0o644, 0o755  # u=rwX,g=rX,o=rX
+LOG_QUEUE_MAX = 10000
+LOG_HISTORY_MAX = 50000
+LOG_DRAIN_MS = 50
+LOG_DRAIN_MAX_LINES = 2000
+LOG_WIDGET_MAX_LINES = 5000
+PROGRESS_UPDATE_MS = 100
+LOG_FILE_BUFFER = 64 * 1024
+LOG_FLUSH_SECONDS = 1.0
+
+# sync_file_range(2) is not exposed by os; bound from libc where present (Linux)
+try:
+    SYNC_FILE_RANGE = ctypes.CDLL(None, use_errno=True).sync_file_range
+    SYNC_FILE_RANGE.argtypes = (ctypes.c_int, ctypes.c_int64, ctypes.c_int64, ctypes.c_uint)
+except (OSError, AttributeError):
+    SYNC_FILE_RANGE = None
 
 NTFS_EXCLUSIONS = [
     ".Trashes", "$RECYCLE.BIN", "System Volume Information", "desktop.ini",
     "Thumbs.db", "Thumbs.db:encryptable", "ehthumbs.db", "ehthumbs_vista.db",
     "@eaDir", ".Spotlight-V100", ".DS_Store", "fuse_hidden*", ".nfs*"
 ]
-EXCLUSION_SET = set(NTFS_EXCLUSIONS)
+# Exact names go in a frozenset; trailing-* patterns (fuse_hidden*, .nfs*) become startswith() prefixes
+EXCLUSION_SET = frozenset(p for p in NTFS_EXCLUSIONS if not p.endswith('*'))
+EXCLUSION_PREFIXES = tuple(p[:-1] for p in NTFS_EXCLUSIONS if p.endswith('*'))
 
 # ============================================================================
 # SAFETY CHECKS
@@ -83,13 +127,35 @@ if SAFETY_ERRORS:
 class ThreadSafeState:
     def __init__(self):
         self._lock = threading.Lock()
+        self._bytes_lock = threading.Lock()
         self._state = {
-            'copy_in_progress': False, 'copy_completed': False, 'copy_failed': False,
-            'cancel_requested': False, 'current_phase': 'idle', 'files_processed': 0,
-            'bytes_transferred': 0, 'errors': [], 'warnings': [], 'checkpoints': []
+            'copy_failed': False, 'current_phase': 'idle',
+            'errors': [], 'warnings': [], 'checkpoints': []
         }
+        # Flags polled from worker loops: Event.is_set() needs no state lock
+        self.copy_in_progress = threading.Event()
+        self.cancel_requested = threading.Event()
+        self.copy_completed = threading.Event()
+        self.reset_counters()
+    
+    def reset_counters(self):
+        # Hot counters stay off self._lock: next() on itertools.count is atomic under
+        # the GIL. Free-threaded builds (PEP 703) need a lock here like _bytes_lock.
+        self._files_counter = itertools.count(1)
+        self._files_last = 0
+        self._bytes = 0
+    
+    def incr_files(self):
+        n = next(self._files_counter)
+        self._files_last = n
+        return n
+    
+    def add_bytes(self, n):
+        with self._bytes_lock: self._bytes += n
     
     def get(self, key, default=None):
+        if key == 'files_processed': return self._files_last
+        if key == 'bytes_transferred': return self._bytes
         with self._lock: return self._state.get(key, default)
     def set(self, key, value):
         with self._lock: self._state[key] = value
@@ -101,6 +167,8 @@ class ThreadSafeState:
         with self._lock:
             self._state = {k: False if isinstance(v, bool) else 0 if isinstance(v, int) else [] 
                           for k, v in self._state.items()}
+        for flag in (self.copy_in_progress, self.cancel_requested, self.copy_completed): flag.clear()
+        self.reset_counters()
 
 # ============================================================================
 # RESOURCE MONITOR
@@ -123,45 +191,348 @@ class ResourceMonitor:
     
     @staticmethod
     def get_memory_mb():
+        # Peak RSS from a single getrusage() call: KB on Linux, bytes on macOS
         try:
-            with open(f'/proc/{os.getpid()}/status') as f:
-                for line in f:
-                    if line.startswith('VmRSS:'): return int(line.split()[1]) / 1024
-        except: pass
-        return 0
+            rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            return rss / (1024**2) if sys.platform == 'darwin' else rss / 1024
+        except: return 0
 
 # ============================================================================
 # AUDIT LOGGER
 # ============================================================================
 class AuditLogger:
-    def __init__(self, callback=None):
-        self.callback = callback
-        self.entries = []
+    def __init__(self):
+        self.entries = deque(maxlen=LOG_HISTORY_MAX)
+        self.entries_dropped = 0
+        self.gui_level = 'info'
+        self._pending = deque(maxlen=LOG_QUEUE_MAX)
+        self.dropped = 0
         self.log_file = None
+        self._flush_timer = None
+        self._ts_cache = (0, '')
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
     
     def init_file_log(self, base="/tmp"):
         try:
             path = os.path.join(base, f"ntfs2ext4_{self.session_id}.log")
-            self.log_file = open(path, 'a', buffering=1)
+            self.log_file = open(path, 'ab', buffering=LOG_FILE_BUFFER)
+            atexit.register(self.flush)
+            self._schedule_flush()
             return path
         except: return None
     
-    def log(self, msg, level='info'):
-        ts = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        entry = f"[{ts}] [{level.upper():7}] {msg}\n"
-        self.entries.append(entry)
-        if self.callback:
-            try: self.root.after(0, lambda: self.callback(entry)) if hasattr(self, 'root') else self.callback(entry)
+    def _schedule_flush(self):
+        self._flush_timer = threading.Timer(LOG_FLUSH_SECONDS, self._periodic_flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+    
+    def _periodic_flush(self):
+        if self.flush(): self._schedule_flush()
+    
+    def flush(self):
+        if self.log_file:
+            try: self.log_file.flush(); return True
             except: pass
+        return False
+    
+    def log(self, msg, level='info'):
+        self.log_lines([msg], level)
+    
+    def log_lines(self, lines, level='info'):
+        if not lines: return
+        # strftime once per second (swapped as one tuple, so threads never see a torn pair); ms per call
+        now = time.time()
+        sec = int(now)
+        cache = self._ts_cache
+        if cache[0] != sec: cache = self._ts_cache = (sec, time.strftime("%H:%M:%S", time.localtime(sec)))
+        prefix = f"[{cache[1]}.{int((now - sec) * 1000):03d}] [{level.upper():7}] "
+        batch = [f"{prefix}{line}\n" for line in lines]
+        # In-memory history is a ring; the log file keeps every entry
+        overflow = len(self.entries) + len(batch) - self.entries.maxlen
+        if overflow > 0: self.entries_dropped += overflow
+        self.entries.extend(batch)
+        # Pulled by the GUI drain tick; no cross-thread Tk call per message.
+        # Debug entries (raw rsync output, per-file lines) go to the file only unless enabled.
+        if level != 'debug' or self.gui_level == 'debug':
+            overflow = len(self._pending) + len(batch) - self._pending.maxlen
+            if overflow > 0: self.dropped += overflow
+            self._pending.extend(batch)
         if self.log_file:
-            try: self.log_file.write(entry); self.log_file.flush()
+            try: self.log_file.write("".join(batch).encode('utf-8'))
             except: pass
     
     def close(self):
+        if self._flush_timer: self._flush_timer.cancel()
         if self.log_file:
             try: self.log_file.close()
             except: pass
+            self.log_file = None
+
+# ============================================================================
+# IN-PROCESS COPIER
+# ============================================================================
+class CopierPool:
+    """Thread-pool copy of a scanned tree; what it cannot create (devices, sockets) or failed goes to rsync."""
+    def __init__(self, state, logger, workers=COPY_WORKERS):
+        self.state = state
+        self.logger = logger
+        self.workers = workers
+        self.reflink = True
+        self.method = 'copy_file_range' if hasattr(os, 'copy_file_range') else 'sendfile'
+        self.noatime = O_NOATIME
+    
+    @staticmethod
+    def target_mode(mode):
+        """u=rwX,g=rX,o=rX for an entry with source `mode`: X keeps execute on dirs and already-executable files."""
+        return DIR_MODE if stat.S_ISDIR(mode) or mode & 0o111 else FILE_MODE
+    
+    @staticmethod
+    def fs_type(path):
+        """Filesystem type of the mount holding `path`, from /proc/self/mountinfo ('' if unknown)."""
+        path, best, fstype = os.path.realpath(path), '', ''
+        try:
+            with open('/proc/self/mountinfo') as f:
+                for line in f:
+                    fields = line.split()
+                    mnt = fields[4]
+                    for esc, ch in (('\\040', ' '), ('\\011', '\t'), ('\\012', '\n'), ('\\134', '\\')): mnt = mnt.replace(esc, ch)
+                    # Later lines stack on top of earlier mounts at the same point
+                    if (path == mnt or path.startswith(mnt.rstrip('/') + '/')) and len(mnt) >= len(best):
+                        best, fstype = mnt, fields[fields.index('-') + 1]
+        except (OSError, ValueError, IndexError): pass
+        return fstype
+    
+    def choose_strategy(self, src, dst):
+        """Pick the first data path from the filesystem types instead of failing into it per file.
+        
+        Reflink needs one CoW filesystem on both sides; copy_file_range only works across
+        mounts of the same type (NFS/CIFS server-side copy, same-fs ext4); otherwise sendfile.
+        """
+        src_fs, dst_fs = self.fs_type(src), self.fs_type(dst)
+        same = bool(src_fs) and src_fs == dst_fs
+        self.reflink = same and dst_fs in REFLINK_FS
+        self.method = 'copy_file_range' if same and hasattr(os, 'copy_file_range') else 'sendfile'
+        order = ['reflink'] * self.reflink + ['copy_file_range'] * (self.method == 'copy_file_range') + ['sendfile', 'buffer']
+        self.logger.log(f"Copy strategy: {src_fs or '?'} -> {dst_fs or '?'} | {' -> '.join(order)}")
+    
+    @staticmethod
+    def bucketize(files, max_bytes=BUCKET_MAX_BYTES, max_count=BUCKET_MAX_FILES):
+        bucket, total = [], 0
+        for rel, sz in files:
+            if bucket and (total + sz > max_bytes or len(bucket) >= max_count):
+                yield bucket
+                bucket, total = [], 0
+            bucket.append((rel, sz))
+            total += sz
+        if bucket: yield bucket
+    
+    def copy_tree(self, src, dst, scan_data):
+        """Copy everything but directory metadata. Returns the (rel, size) entries left for rsync."""
+        src_root, dst_root = src.rstrip('/') + '/', dst.rstrip('/') + '/'
+        self.choose_strategy(src, dst)
+        # Whole directory tree up front (sorted puts parents first), so workers never mkdir
+        for rel in sorted(scan_data['dir_list']):
+            try: self._make_dir(dst_root + rel)
+            except OSError as e: self.logger.log(f" mkdir failed {rel}: {e}", 'warning')
+        
+        # Path order keeps each batch within contiguous directories; batches are capped at a
+        # per-worker share (by count and bytes) so small trees still spread across every worker
+        files = sorted(scan_data['file_list'])
+        share = -(-len(files) // self.workers)
+        share_bytes = -(-sum(sz for _, sz in files) // self.workers)
+        batches = list(self.bucketize(files, max_bytes=min(BUCKET_MAX_BYTES, max(1, share_bytes)),
+                                      max_count=min(BUCKET_MAX_FILES, max(1, share))))
+        others = scan_data['other_list']
+        self.logger.log(f"Copy batches: {len(batches):,} | other entries: {len(others):,} | workers: {self.workers}")
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            failed = [f for batch_failed in pool.map(lambda b: self._copy_batch(src_root, dst_root, b), batches)
+                      for f in batch_failed]
+            done = pool.map(lambda rel: self._copy_special(src_root + rel, dst_root + rel), others)
+            failed += [(rel, 0) for rel, ok in zip(others, done) if not ok]
+        return failed
+    
+    @staticmethod
+    def _make_dir(path):
+        """mkdir that only accepts a real directory already there; a symlink (or file) in its place is
+        replaced, as rsync does, so nothing below it is ever written through the link."""
+        try: os.mkdir(path)
+        except FileExistsError:
+            if stat.S_ISDIR(os.lstat(path).st_mode): return
+            os.unlink(path)
+            os.mkdir(path)
+    
+    def restore_dirs(self, src, dst, dir_list):
+        """DIR_MODE and source timestamps for every directory; run after all entries exist, since creating them bumps mtimes."""
+        src_root, dst_root = src.rstrip('/') + '/', dst.rstrip('/') + '/'
+        def restore(rel):
+            if self.state.cancel_requested.is_set(): return
+            try:
+                st = os.stat(src_root + rel)
+                # lchmod is unavailable on Linux, so check the entry itself before the chmod
+                if not stat.S_ISDIR(os.lstat(dst_root + rel).st_mode):
+                    raise OSError(errno.ENOTDIR, "not a directory in destination")
+                os.chmod(dst_root + rel, DIR_MODE)
+                os.utime(dst_root + rel, ns=(st.st_atime_ns, st.st_mtime_ns), follow_symlinks=False)
+            except OSError as e:
+                self.logger.log(f" Directory metadata {rel}: {e}", 'warning')
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            list(pool.map(restore, dir_list))
+    
+    def _fast_copy(self, src_fd, dst_fd, size):
+        """Move one file's data in-kernel: FICLONE reflink -> copy_file_range -> sendfile -> 1 MiB buffer.
+        
+        Returns the method that completed the copy.
+        """
+        if self.reflink:
+            try:
+                fcntl.ioctl(dst_fd, FICLONE, src_fd)
+                self.state.add_bytes(size)
+                return 'reflink'
+            except OSError as e:
+                if e.errno not in (errno.EOPNOTSUPP, errno.EXDEV, errno.ENOTTY, errno.EINVAL): raise
+                # Filesystem-level refusal holds for the whole session; EINVAL is per file
+                if e.errno != errno.EINVAL: self.reflink = False
+        
+        done, method, buf = 0, self.method, None
+        prev = flushed = 0
+        while True:
+            if self.state.cancel_requested.is_set(): raise RuntimeError("Cancelled")
+            chunk = max(min(size - done, FAST_COPY_CHUNK), FALLBACK_BUFFER)
+            try:
+                if method == 'copy_file_range':
+                    n = os.copy_file_range(src_fd, dst_fd, chunk)
+                elif method == 'sendfile':
+                    n = os.sendfile(dst_fd, src_fd, done, chunk)
+                else:
+                    if buf is None:
+                        buf = bytearray(FALLBACK_BUFFER)
+                        os.lseek(src_fd, done, os.SEEK_SET)
+                    n = os.readv(src_fd, [buf])
+                    view = memoryview(buf)[:n]
+                    while view: view = view[os.write(dst_fd, view):]
+            except OSError as e:
+                if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP) or method == 'buffer': raise
+                # A filesystem-level copy_file_range refusal holds for the session; EINVAL is per file
+                if method == 'copy_file_range' and e.errno != errno.EINVAL: self.method = 'sendfile'
+                method = 'sendfile' if method == 'copy_file_range' else 'buffer'
+                os.lseek(dst_fd, done, os.SEEK_SET)
+                continue
+            if not n:
+                if done < size:
+                    # Short copy: retry the rest with the next method; a file that really shrank fails
+                    # here (and goes to the rsync fallback) instead of being stamped as complete
+                    if method == 'buffer': raise OSError(errno.EIO, f"Short copy: {done:,} of {size:,} bytes")
+                    method = 'sendfile' if method == 'copy_file_range' else 'buffer'
+                    os.lseek(dst_fd, done, os.SEEK_SET)
+                    continue
+                if flushed: self._writeback(dst_fd, 0, done, wait=True)
+                return method
+            done += n
+            self.state.add_bytes(n)
+            if done - flushed >= FAST_COPY_CHUNK:
+                # Stream dirty pages out per window: start this one, finish and drop the previous
+                self._writeback(dst_fd, flushed, done)
+                self._writeback(dst_fd, prev, flushed, wait=True)
+                prev, flushed = flushed, done
+    
+    @staticmethod
+    def _fadvise(fd, *advice):
+        """Best-effort page-cache hints (POSIX_FADV_<name>); ignored where unsupported, e.g. some FUSE mounts."""
+        if not hasattr(os, 'posix_fadvise'): return
+        for name in advice:
+            try: os.posix_fadvise(fd, 0, 0, getattr(os, 'POSIX_FADV_' + name))
+            except (AttributeError, OSError): pass
+    
+    @staticmethod
+    def _writeback(fd, start, end, wait=False):
+        """Start writeback of [start, end); with wait, block until it is on disk and drop the clean pages."""
+        if SYNC_FILE_RANGE is None or end <= start: return
+        SYNC_FILE_RANGE(fd, start, end - start, SYNC_FILE_RANGE_WAIT if wait else SYNC_FILE_RANGE_WRITE)
+        if wait:
+            try: os.posix_fadvise(fd, start, end - start, os.POSIX_FADV_DONTNEED)
+            except (AttributeError, OSError): pass
+    
+    def _open_source(self, path):
+        # O_NOATIME is refused (EPERM) on files we do not own; stop asking after the first refusal
+        if self.noatime:
+            try: return os.open(path, os.O_RDONLY | self.noatime)
+            except PermissionError as e:
+                if e.errno != errno.EPERM: raise  # EACCES: unreadable regardless of the flag
+                self.noatime = 0
+        return os.open(path, os.O_RDONLY)
+    
+    def _copy_file(self, src_path, dst_path):
+        """Copy one regular file with its target mode and timestamps; skipped if dst already matches (size + mtime)."""
+        src_fd = self._open_source(src_path)
+        try:
+            st = os.fstat(src_fd)
+            try:
+                dst_st = os.lstat(dst_path)
+                if not stat.S_ISREG(dst_st.st_mode):
+                    # Never write through a symlink (or into a FIFO) left at the destination: replace it
+                    if not stat.S_ISDIR(dst_st.st_mode): os.unlink(dst_path)
+                elif dst_st.st_size == st.st_size and dst_st.st_mtime_ns == st.st_mtime_ns:
+                    mode = self.target_mode(st.st_mode)
+                    if stat.S_IMODE(dst_st.st_mode) != mode: os.chmod(dst_path, mode)
+                    self.state.add_bytes(st.st_size)  # counts toward progress like a copied file
+                    return
+            except FileNotFoundError: pass
+            # Read strictly once, front to back: aggressive readahead, then drop the pages
+            self._fadvise(src_fd, 'SEQUENTIAL')
+            if st.st_size <= WILLNEED_MAX_BYTES: self._fadvise(src_fd, 'WILLNEED')
+            dst_fd = os.open(dst_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_NOFOLLOW, 0o600)
+            try:
+                method = self._fast_copy(src_fd, dst_fd, st.st_size)
+                os.fchmod(dst_fd, self.target_mode(st.st_mode))
+                os.utime(dst_fd, ns=(st.st_atime_ns, st.st_mtime_ns))
+            finally:
+                os.close(dst_fd)
+            self._fadvise(src_fd, 'DONTNEED')
+        finally:
+            os.close(src_fd)
+        self.state.incr_files()
+        self.logger.log(f"⚡ {dst_path} | {st.st_size/(1024**2):.1f}MB | {method}", 'debug')
+    
+    def _copy_batch(self, src_root, dst_root, batch):
+        """In-process copy of one bucket of regular files. Returns the (rel, size) entries that failed."""
+        # rel is always a clean relative path from the scan, so plain concatenation
+        # replaces os.path.join in the per-file loop
+        failed = []
+        for rel, sz in batch:
+            if self.state.cancel_requested.is_set(): break
+            try:
+                self._copy_file(src_root + rel, dst_root + rel)
+            except Exception as e:
+                if self.state.cancel_requested.is_set(): break
+                self.logger.log(f" Copy error {rel}: {e}", 'warning')
+                failed.append((rel, sz))
+        return failed
+    
+    def _copy_special(self, src_path, dst_path):
+        """Recreate a symlink or FIFO (target mode, source timestamps). False for anything else (left to rsync)."""
+        if self.state.cancel_requested.is_set(): return True
+        try:
+            st = os.lstat(src_path)
+            if stat.S_ISLNK(st.st_mode):
+                target = os.readlink(src_path)
+                if os.path.islink(dst_path) and os.readlink(dst_path) == target:
+                    self.state.add_bytes(st.st_size)
+                    return True
+                if os.path.lexists(dst_path): os.unlink(dst_path)
+                os.symlink(target, dst_path)
+            elif stat.S_ISFIFO(st.st_mode):
+                if os.path.lexists(dst_path): os.unlink(dst_path)
+                os.mkfifo(dst_path)
+                os.chmod(dst_path, self.target_mode(st.st_mode))
+            else:
+                return False
+            os.utime(dst_path, ns=(st.st_atime_ns, st.st_mtime_ns), follow_symlinks=False)
+            self.state.add_bytes(st.st_size)  # the scan total includes the link's own size
+            self.state.incr_files()
+            return True
+        except OSError as e:
+            self.logger.log(f" Copy error {dst_path}: {e}", 'warning')
+            return False
 
 # ============================================================================
 # MAIN GUI CLASS
@@ -171,12 +542,13 @@ class ForensicCopyGUI:
         self.root = root
         self.root.title(f"NTFS --> EXT4 | by jm@qvert.net | v{VERSION}")
         self.state = ThreadSafeState()
-        self.logger = AuditLogger(callback=self._gui_log)
-        self.logger.root = root
+        self.logger = AuditLogger()
         self.monitor = ResourceMonitor()
         self.copy_thread = None
         self.scan_cache = None
         self.retry_count = 0
+        self._procs = []
+        self._procs_lock = threading.Lock()
         
         self.root.geometry("1920x1080")
         self.root.minsize(1400, 900)
@@ -195,8 +567,11 @@ class ForensicCopyGUI:
         for i in range(7): self.root.grid_rowconfigure(i, weight=1 if i==5 else 0)
         self.root.grid_columnconfigure(1, weight=1)
         
+        self._dropped_seen = 0
+        
         self._build_ui()
         self._log_startup()
+        self.root.after(LOG_DRAIN_MS, self._drain_log)
     
     def _build_ui(self):
         # Row 0: Source
@@ -228,7 +603,7 @@ class ForensicCopyGUI:
         self.btn_cancel.grid_remove()
         
         # Row 3: Progress
-        self.progress = ttk.Progressbar(self.root, mode='indeterminate', orient=tk.HORIZONTAL)
+        self.progress = ttk.Progressbar(self.root, mode='determinate', orient=tk.HORIZONTAL)
         self.progress.grid(row=3, column=0, columnspan=3, sticky="ew", padx=self.PAD_X*2, pady=self.PAD_Y)
         self.progress.grid_remove()
         self.progress_label = tk.Label(self.root, text="", font=("Segoe UI", 20), fg="#1a5fb4")
@@ -237,7 +612,11 @@ class ForensicCopyGUI:
         
         # Row 4: Log Label
         tk.Label(self.root, text="AUDIT LOG:", font=self.FONT_LABEL, anchor='w').grid(
-            row=4, column=0, columnspan=3, sticky="w", padx=self.PAD_X, pady=self.PAD_Y)
+            row=4, column=0, columnspan=2, sticky="w", padx=self.PAD_X, pady=self.PAD_Y)
+        self.verbose_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(self.root, text="Verbose (rsync output)", variable=self.verbose_var,
+                      command=self._toggle_verbose, font=self.FONT_LABEL).grid(
+            row=4, column=2, sticky="e", padx=self.PAD_X, pady=self.PAD_Y)
         
         # Row 5: Log Area
         self.log_frame = tk.Frame(self.root)
@@ -260,7 +639,7 @@ class ForensicCopyGUI:
         self.logger.log("="*100)
         self.logger.log(f"SESSION: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         self.logger.log(f"APP: NTFS-->EXT4 v{VERSION} | {AUTHOR}")
-        self.logger.log(f"PYTHON: {sys.version.split()[0]} | TK: {tk.TkVersion}")
+        self.logger.log(f"PYTHON: {sys.version.split()[0]} | TK: {tk.TkVersion} | SCANNER: {'scandir_rs' if scandir_rs else 'Python'}")
         self.logger.log(f"USER: {os.getenv('USER')} | UID: {os.getuid()}")
         for w in SAFETY_WARNINGS: self.logger.log(f" {w}", 'warning')
         log_path = self.logger.init_file_log()
@@ -268,15 +647,30 @@ class ForensicCopyGUI:
         self.logger.log("="*100)
         self.logger.log("✅ READY")
     
-    def _gui_log(self, text):
-        try: self.root.after(0, lambda: self._insert_log(text))
-        except: pass
+    def _toggle_verbose(self):
+        self.logger.gui_level = 'debug' if self.verbose_var.get() else 'info'
+    
+    def _drain_log(self):
+        # One Text insert per tick, capped so a burst is spread over several ticks
+        pending, buf = self.logger._pending, []
+        try:
+            for _ in range(min(len(pending), LOG_DRAIN_MAX_LINES)): buf.append(pending.popleft())
+        except IndexError: pass
+        dropped = self.logger.dropped
+        if dropped > self._dropped_seen:
+            buf.insert(0, f"[... {dropped - self._dropped_seen:,} log lines not shown, see log file ...]\n")
+            self._dropped_seen = dropped
+        if buf: self._insert_log("".join(buf))
+        self.root.after(LOG_DRAIN_MS, self._drain_log)
     
     def _insert_log(self, text):
         try:
             self.log.insert(tk.END, text)
+            # Keep only the newest lines in the widget; the full record is in the log file.
+            # Text always ends in a newline, so end-1c sits on the empty line after the last one
+            excess = int(self.log.index('end-1c').split('.')[0]) - 1 - LOG_WIDGET_MAX_LINES
+            if excess > 0: self.log.delete('1.0', f'{excess + 1}.0')
             self.log.see(tk.END)
-            self.root.update_idletasks()
         except: pass
     
     def _browse_src(self):
@@ -311,76 +705,205 @@ class ForensicCopyGUI:
         self.logger.log("\n🔍 SCANNING SOURCE...")
         start = time.time()
         data = {'files': 0, 'dirs': 0, 'size': 0, 'hidden_files': [], 'hidden_dirs': [], 
-                'conflicts': {}, 'samples': [], 'errors': []}
+                'conflicts': [], 'conflict_count': 0, 'samples': [], 'errors': [], 'file_list': [], 'dir_list': [], 'other_list': [],
+                'unscanned': []}
+        
+        # entry.path always extends the normalized root, so rel is a plain slice
+        src = os.path.normpath(src)
+        prefix_len = len(src.rstrip('/')) + 1
+        lock = threading.Lock()
+        local = threading.local()
+        
+        def scan_dir(path):
+            # Per-task accumulators as plain locals with pre-bound methods (no dict
+            # lookups or attribute loads per entry), merged into `data` once under the lock
+            files = dirs = size = 0
+            hidden_files, hidden_dirs, samples, errors = [], [], [], []
+            file_list, dir_list, other_list, subdirs, unscanned = [], [], [], [], []
+            # Case conflicts only matter within one directory: lower -> original, dropped on return
+            seen, conflicts, rel_dir = {}, [], path[prefix_len:]
+            excl, prefixes = EXCLUSION_SET, EXCLUSION_PREFIXES
+            add_file, add_dir, add_subdir = file_list.append, dir_list.append, subdirs.append
+            # Samples still wanted, read once per task: 0 skips the branch for the rest of the scan
+            need = 10 - len(data['samples'])
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        name = entry.name
+                        if name in excl or name.startswith(prefixes): continue
+                        rel = entry.path[prefix_len:]
+                        other = seen.setdefault(name.lower(), name)
+                        if other is not name: conflicts.append((rel_dir, other, name))
+                        if entry.is_dir(follow_symlinks=False):
+                            dirs += 1
+                            if name[:1] == '.': hidden_dirs.append(rel)
+                            add_dir(rel)
+                            add_subdir(entry.path)
+                            continue
+                        files += 1
+                        if name[:1] == '.': hidden_files.append(rel)
+                        sz = 0
+                        try:
+                            sz = entry.stat(follow_symlinks=False).st_size
+                            size += sz
+                            if need and sz > 1024:
+                                samples.append((rel, sz))
+                                need -= 1
+                        except Exception as e:
+                            errors.append(f"Size error {rel}: {e}")
+                        if entry.is_file(follow_symlinks=False): add_file((rel, sz))
+                        else: other_list.append(rel)
+            except OSError as e:
+                # Its subtree is unknown: rsync copies it whole (and fails the run if it still cannot read it)
+                errors.append(f"Scan error {path}: {e}")
+                unscanned.append(rel_dir or '.')
+            
+            # Memory check every 10k files (per worker)
+            before = getattr(local, 'files', 0)
+            local.files = before + files
+            if local.files // 10000 > before // 10000:
+                mem = self.monitor.get_memory_mb()
+                if mem > MAX_FILE_SCAN_MEMORY_MB:
+                    self.logger.log(f" Memory: {mem:.0f}MB", 'warning')
+            
+            with lock:
+                data['files'] += files
+                data['dirs'] += dirs
+                data['size'] += size
+                data['hidden_files'] += hidden_files
+                data['hidden_dirs'] += hidden_dirs
+                data['errors'] += errors
+                data['file_list'] += file_list
+                data['dir_list'] += dir_list
+                data['other_list'] += other_list
+                data['unscanned'] += unscanned
+                data['conflict_count'] += len(conflicts)
+                data['conflicts'] += conflicts[:CASE_CONFLICT_MAX - len(data['conflicts'])]
+                data['samples'] += samples[:10 - len(data['samples'])]
+            return subdirs
         
         try:
-            for root, dirs, files in os.walk(src, topdown=True):
-                dirs[:] = [d for d in dirs if d not in EXCLUSION_SET]
-                for d in dirs:
-                    data['dirs'] += 1
-                    if d.startswith('.') and d not in EXCLUSION_SET:
-                        data['hidden_dirs'].append(os.path.relpath(os.path.join(root,d), src))
-                for f in files:
-                    if f in EXCLUSION_SET: continue
-                    data['files'] += 1
-                    rel = os.path.relpath(os.path.join(root,f), src)
-                    if f.startswith('.') and f not in EXCLUSION_SET:
-                        data['hidden_files'].append(rel)
-                    try:
-                        sz = os.path.getsize(os.path.join(root,f))
-                        data['size'] += sz
-                        if len(data['samples']) < 10 and sz > 1024:
-                            data['samples'].append((rel, sz))
-                    except Exception as e:
-                        data['errors'].append(f"Size error {rel}: {e}")
-                    key = f.lower()
-                    if key not in data['conflicts']: data['conflicts'][key] = []
-                    data['conflicts'][key].append(f)
-                
-                # Memory check every 10k files
-                if data['files'] % 10000 == 0:
-                    mem = self.monitor.get_memory_mb()
-                    if mem > MAX_FILE_SCAN_MEMORY_MB:
-                        self.logger.log(f" Memory: {mem:.0f}MB", 'warning')
+            walked = None
+            if scandir_rs is not None:
+                try: walked = self._walk_rs(src)
+                except Exception as e: self.logger.log(f" scandir_rs walk failed ({e}), using Python scanner", 'warning')
+            if walked is not None:
+                data.update(walked)
+            else:
+                with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+                    pending = {pool.submit(scan_dir, src)}
+                    while pending:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for fut in done:
+                            pending.update(pool.submit(scan_dir, d) for d in fut.result())
         except Exception as e:
             data['errors'].append(f"Scan exception: {e}")
         
-        data['conflicts'] = {k:v for k,v in data['conflicts'].items() if len(set(v))>1}
         data['duration'] = time.time() - start
         
         self.logger.log(f"✅ SCAN: {data['files']:,} files | {data['dirs']:,} dirs | {data['size']/(1024**3):.2f}GB | {data['duration']:.2f}s")
         if data['hidden_files']: self.logger.log(f"   Hidden: {len(data['hidden_files']):,}")
-        if data['conflicts']: self.logger.log(f"    Case conflicts: {len(data['conflicts']):,}")
+        if data['conflict_count']:
+            self.logger.log(f"    Case conflicts: {data['conflict_count']:,}", 'warning')
+            self.logger.log_lines([f"      {d or '.'}/: {a} <-> {b}" for d, a, b in data['conflicts'][:10]], 'warning')
         if data['errors']: self.logger.log(f"   Errors: {len(data['errors'])}", 'warning')
+        if data['unscanned']: self.logger.log(f"   Unreadable directories: {len(data['unscanned']):,} (left to rsync)", 'warning')
         
         return data
     
-    def _confirm_copy(self, src, dst, data):
+    def _walk_rs(self, src):
+        """scan_dir's results from a single scandir_rs walk (parallel, outside the GIL), reduced in one pass."""
+        # dir_exclude does not stop every excluded directory (e.g. .nfs*) being descended into,
+        # so entries are filtered again below, by name and by every component of their parent
+        entries, errors = scandir_rs.Scandir(src, return_type=scandir_rs.ReturnType.Ext, case_sensitive=True,
+                                             dir_exclude=NTFS_EXCLUSIONS, file_exclude=NTFS_EXCLUSIONS).collect()
+        # Which directories failed is what the copy needs; scan_dir records that, so let it rescan
+        if errors: raise RuntimeError(f"{len(errors):,} scan errors")
+        out = {'files': 0, 'dirs': 0, 'size': 0, 'hidden_files': [], 'hidden_dirs': [], 'conflicts': [],
+               'conflict_count': 0, 'samples': [], 'errors': [], 'file_list': [], 'dir_list': [], 'other_list': [],
+               'unscanned': []}
+        excl, prefixes = EXCLUSION_SET, EXCLUSION_PREFIXES
+        add_file, add_dir, add_other = out['file_list'].append, out['dir_list'].append, out['other_list'].append
+        conflicts, seen, need = out['conflicts'], {}, 10
+        # Case conflicts per directory, as in scan_dir: the walker emits each directory's entries
+        # as one run, so `seen` is reset per run. A directory seen again means that no longer
+        # holds; raising falls back to the Python scanner rather than missing conflicts.
+        current, finished, pruned = None, set(), False
+        files = dirs = size = 0
+        for entry in entries:
+            rel = entry.path
+            parent, _, name = rel.rpartition('/')
+            if parent != current:
+                if parent in finished: raise RuntimeError("scandir_rs entries not grouped by directory")
+                finished.add(current)
+                current, seen = parent, {}
+                # Anything below an excluded directory is excluded, as scan_dir never enters one
+                pruned = any(c in excl or c.startswith(prefixes) for c in parent.split('/') if c)
+            if pruned or name in excl or name.startswith(prefixes): continue
+            other = seen.setdefault(name.lower(), name)
+            if other is not name:
+                out['conflict_count'] += 1
+                if len(conflicts) < CASE_CONFLICT_MAX: conflicts.append((parent, other, name))
+            if entry.is_dir:
+                dirs += 1
+                if name[:1] == '.': out['hidden_dirs'].append(rel)
+                add_dir(rel)
+                continue
+            files += 1
+            # Memory check every 10k files, like scan_dir
+            if not files % 10000:
+                mem = self.monitor.get_memory_mb()
+                if mem > MAX_FILE_SCAN_MEMORY_MB: self.logger.log(f" Memory: {mem:.0f}MB", 'warning')
+            if name[:1] == '.': out['hidden_files'].append(rel)
+            # st_size is the link's own size for symlinks; st_mode is not, so classify by flags
+            sz = entry.st_size
+            size += sz
+            if need and sz > 1024:
+                out['samples'].append((rel, sz))
+                need -= 1
+            if entry.is_file: add_file((rel, sz))
+            else: add_other(rel)
+        out['files'], out['dirs'], out['size'] = files, dirs, size
+        return out
+    
+    def _confirm_copy(self, src, dst, data, proceed):
+        """Ask for confirmation, then call proceed(bool). Never blocks the event loop."""
         size_gb = data['size'] / (1024**3)
         self.logger.log("\n" + "="*50)
         self.logger.log("️  CONFIRMATION REQUIRED")
         self.logger.log(f"SOURCE: {src}")
         self.logger.log(f"DEST: {dst}")
         self.logger.log(f"FILES: {data['files']:,} | SIZE: {size_gb:.2f}GB")
-        self.logger.log(f"HIDDEN: {len(data['hidden_files']):,} | CONFLICTS: {len(data['conflicts']):,}")
+        self.logger.log(f"HIDDEN: {len(data['hidden_files']):,} | CONFLICTS: {data['conflict_count']:,}")
         
         self.status_var.set(f"Confirm: {size_gb:.1f}GB, {data['files']:,} files")
         
         if size_gb > 0.1:
-            msg = f"COPY {size_gb:.2f} GB?\n\n{data['files']:,} files\n{len(data['hidden_files']):,} hidden files\n{len(data['conflicts']):,} case conflicts\n\nProceed?"
+            msg = f"COPY {size_gb:.2f} GB?\n\n{data['files']:,} files\n{len(data['hidden_files']):,} hidden files\n{data['conflict_count']:,} case conflicts\n\nProceed?"
             try:
-                return messagebox.askyesno("CONFIRM", msg, icon=messagebox.WARNING, parent=self.root)
+                answer = messagebox.askyesno("CONFIRM", msg, icon=messagebox.WARNING, parent=self.root)
             except Exception as e:
                 self.logger.log(f" Dialog failed: {e}", 'warning')
                 self.logger.log("   Auto-proceeding in 5s...")
-                for i in range(5,0,-1):
-                    self.logger.log(f"   {i}...")
-                    time.sleep(1)
-                return True
-        return True
+                self.btn.config(state=tk.DISABLED)
+                self._countdown_remaining = 5
+                self._countdown_tick(proceed)
+                return
+            proceed(answer)
+            return
+        proceed(True)
+    
+    def _countdown_tick(self, proceed):
+        if self._countdown_remaining <= 0:
+            self.btn.config(state=tk.NORMAL)
+            proceed(True)
+            return
+        self.logger.log(f"   {self._countdown_remaining}...")
+        self._countdown_remaining -= 1
+        self.root.after(1000, lambda: self._countdown_tick(proceed))
     
     def _start_copy(self):
-        if self.state.get('copy_in_progress'):
+        if self.state.copy_in_progress.is_set():
             self.logger.log(" Copy already running", 'warning')
             return
         
@@ -395,18 +918,33 @@ class ForensicCopyGUI:
             messagebox.showerror("VALIDATION FAILED", "\n".join(errors))
             return
         
-        # Stage 2: Scan
+        # Stage 2: Scan on a worker thread so the event loop keeps drawing and draining the log
         self.logger.log("\n STAGE 2: SCAN")
-        try:
-            self.scan_cache = self._scan_source(src)
-        except Exception as e:
-            self.logger.log(f" Scan failed: {e}", 'error')
-            messagebox.showerror("SCAN FAILED", str(e))
+        self.btn.config(state=tk.DISABLED)
+        self.status_var.set("Status: Scanning...")
+        threading.Thread(target=self._run_scan, args=(src, dst), daemon=True).start()
+    
+    def _run_scan(self, src, dst):
+        try: data, error = self._scan_source(src), None
+        except Exception as e: data, error = None, e
+        try: self.root.after(0, lambda: self._scan_done(src, dst, data, error))
+        except: pass  # window closed mid-scan
+    
+    def _scan_done(self, src, dst, data, error):
+        self.btn.config(state=tk.NORMAL)
+        if error:
+            self.logger.log(f" Scan failed: {error}", 'error')
+            self.status_var.set("Scan failed")
+            messagebox.showerror("SCAN FAILED", str(error))
             return
+        self.scan_cache = data
         
         # Stage 3: Confirm
         self.logger.log("\n STAGE 3: CONFIRMATION")
-        if not self._confirm_copy(src, dst, self.scan_cache):
+        self._confirm_copy(src, dst, self.scan_cache, lambda ok: self._launch_copy(src, dst, ok))
+    
+    def _launch_copy(self, src, dst, confirmed):
+        if not confirmed:
             self.logger.log(" Cancelled by user")
             self.status_var.set("Cancelled")
             return
@@ -421,85 +959,179 @@ class ForensicCopyGUI:
         
         # Launch copy thread
         self.logger.log("\n STAGE 5: LAUNCHING COPY")
-        self.state.set('copy_in_progress', True)
+        self.state.copy_in_progress.set()
         self.state.set('current_phase', 'copying')
         self.btn.grid_remove()
         self.btn_cancel.grid()
+        self.progress.config(maximum=max(self.scan_cache['size'], 1), value=0)
         self.progress.grid()
-        self.progress.start(10)
         self.status_var.set("Status: Copying...")
         
         self.copy_thread = threading.Thread(target=self._run_copy, args=(src, dst, self.scan_cache), daemon=False)
         self.copy_thread.start()
         self.logger.log("✅ Copy thread launched")
+        self._update_progress()
+    
+    def _update_progress(self):
+        # Determinate bar polled from the copier's byte counter; stops with the copy, or on
+        # cancel so "Cancelling..." from _cancel_copy stays visible
+        if not self.state.copy_in_progress.is_set() or self.state.cancel_requested.is_set(): return
+        total = self.progress['maximum']
+        done = min(self.state.get('bytes_transferred'), total)
+        self.progress['value'] = done
+        self.status_var.set(f"Status: Copying... {done/(1024**3):.2f}/{total/(1024**3):.2f} GB ({done/total:.0%})")
+        self.root.after(PROGRESS_UPDATE_MS, self._update_progress)
+    
+    @staticmethod
+    def _safe_stat(path):
+        """Size of `path` from a single lstat, or None if it cannot be stat'ed."""
+        try: return os.stat(path, follow_symlinks=False).st_size
+        except OSError: return None
+    
+    @staticmethod
+    def _inodes_used(path):
+        """Used inodes on the filesystem holding `path`; None where not reported (btrfs, some FUSE mounts)."""
+        try:
+            st = os.statvfs(path)
+            return st.f_files - st.f_ffree if st.f_files else None
+        except OSError: return None
+    
+    @staticmethod
+    def _apply_mode(path):
+        """u=rwX,g=rX,o=rX on one entry; X keeps execute on dirs and already-executable files."""
+        try: st = os.lstat(path)
+        except FileNotFoundError: return
+        if stat.S_ISLNK(st.st_mode): return
+        mode = CopierPool.target_mode(st.st_mode)
+        if stat.S_IMODE(st.st_mode) != mode: os.chmod(path, mode)
+    
+    def _rsync_list(self, src, dst, rels, resume=False, recursive=False):
+        """Run one rsync over an explicit file list. Returns the exit code, None if cancelled.
+        
+        resume appends to files left partial by a failed attempt instead of re-sending them.
+        recursive copies listed directories whole (--files-from otherwise turns off -a's -r).
+        """
+        if self.state.cancel_requested.is_set(): return None
+        with tempfile.NamedTemporaryFile('w', prefix='ntfs2ext4_', suffix='.list') as lst:
+            lst.write("\0".join(rels) + "\0")
+            lst.flush()
+            cmd = ["rsync", "-aSh", "--numeric-ids", "--whole-file", "--no-compress", "--partial", "--inplace",
+                   "--info=progress2,stats2"]
+            if resume: cmd.append("--append-verify")
+            if recursive: cmd.append("-r")
+            cmd += ["--from0", f"--files-from={lst.name}", "--exclude-from=-", f"{src}/", f"{dst}/"]
+            self.logger.log(f"Command: {' '.join(cmd)} ({len(rels):,} entries)", 'debug')
+            proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, 
+                                   stderr=subprocess.STDOUT, cwd=src)
+            with self._procs_lock: self._procs.append(proc)
+            # --from0 applies to the exclude list as well
+            proc.stdin.write(("\0".join(NTFS_EXCLUSIONS) + "\0").encode('utf-8'))
+            proc.stdin.close()
+            
+            # Raw 64 KiB reads, decoded and split once per chunk; cancel polled per tick
+            decoder = codecs.getincrementaldecoder('utf-8')('replace')
+            tail = ''
+            with selectors.DefaultSelector() as sel:
+                sel.register(proc.stdout, selectors.EVENT_READ)
+                while True:
+                    if self.state.cancel_requested.is_set():
+                        proc.terminate()
+                        break
+                    if not sel.select(timeout=0.2): continue
+                    data = os.read(proc.stdout.fileno(), 65536)
+                    if not data: break
+                    segs = (tail + decoder.decode(data)).replace('\r', '\n').split('\n')
+                    tail = segs.pop()
+                    self.logger.log_lines([seg.rstrip() for seg in segs if seg.strip()], 'debug')
+            if tail.strip(): self.logger.log(tail.rstrip(), 'debug')
+            proc.stdout.close()
+            
+            proc.wait()
+            with self._procs_lock: self._procs.remove(proc)
+            return None if self.state.cancel_requested.is_set() else proc.returncode
     
     def _run_copy(self, src, dst, scan_data):
         attempt = 0
         success = False
         
-        while attempt < RETRY_ATTEMPTS and not success:
+        while attempt < RETRY_ATTEMPTS and not success and not self.state.cancel_requested.is_set():
             attempt += 1
             self.logger.log(f"\n{'='*100}")
             self.logger.log(f" COPY ATTEMPT {attempt}/{RETRY_ATTEMPTS}")
             self.logger.log(f"{'='*100}")
             
+            copier = CopierPool(self.state, self.logger)
+            self.state.reset_counters()  # each attempt recounts skipped files toward the progress total
             try:
                 # Create destination
+                fresh = not os.path.lexists(dst)
+                # Read from dst itself when it exists: a mount point sits on a different filesystem than its parent
+                inodes_before = self._inodes_used(os.path.dirname(dst.rstrip('/')) or '/' if fresh else dst)
                 os.makedirs(dst, exist_ok=True)
+                os.chmod(dst, DIR_MODE)
                 self.logger.log(f"✅ Destination created: {dst}")
                 
-                # Build rsync command
-                cmd = ["rsync", "-avh", "--progress", "--stats", "--exclude-from=-"]
-                cmd += [f"{src}/", f"{dst}/"]
-                self.logger.log(f"Command: {' '.join(cmd)}")
+                # Everything in-process; rsync only sees entries the copier could not
+                # create (device nodes, sockets) or that failed
+                fallback = copier.copy_tree(src, dst, scan_data)
+                self.logger.log(f"In-process: {self.state.get('files_processed'):,} entries | "
+                                f"{self.state.get('bytes_transferred')/(1024**3):.2f}GB")
+                if fallback: self.logger.log(f" {len(fallback):,} entries falling back to rsync", 'warning')
+                with ThreadPoolExecutor(max_workers=RSYNC_WORKERS) as pool:
+                    codes = list(pool.map(lambda b: self._rsync_list(src, dst, [rel for rel, _ in b], resume=attempt > 1),
+                                          copier.bucketize(sorted(fallback))))
+                # Directories the scan could not read go to rsync whole; an error there fails the attempt
+                unscanned = scan_data['unscanned']
+                if unscanned:
+                    self.logger.log(f" {len(unscanned):,} unscanned directories copied by rsync", 'warning')
+                    codes.append(self._rsync_list(src, dst, sorted(unscanned), resume=attempt > 1, recursive=True))
                 
-                # Execute rsync
-                proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, 
-                                       stderr=subprocess.STDOUT, text=True, bufsize=1, cwd=src)
-                proc.stdin.write("\n".join(NTFS_EXCLUSIONS) + "\n")
-                proc.stdin.close()
+                # Directory metadata last, once nothing else is written below them
+                copier.restore_dirs(src, dst, scan_data['dir_list'])
                 
-                # Stream output
-                for line in proc.stdout:
-                    if self.state.get('cancel_requested'):
-                        proc.terminate()
-                        self.logger.log(" Cancelled by user", 'warning')
-                        break
-                    for seg in line.replace('\r','\n').split('\n'):
-                        clean = seg.rstrip()
-                        if clean: self.logger.log(clean)
+                if self.state.cancel_requested.is_set():
+                    self.logger.log(" Cancelled by user", 'warning')
+                    break
+                failed = sorted({c for c in codes if c})
+                if failed:
+                    raise RuntimeError(f"rsync exit code {', '.join(map(str, failed))}")
                 
-                proc.wait()
-                
-                if proc.returncode != 0:
-                    raise RuntimeError(f"rsync exit code {proc.returncode}")
-                
-                self.logger.log("\n✅ RSYNC COMPLETE")
-                
-                # Set permissions
-                self.logger.log(" Setting permissions...")
-                subprocess.run(["chmod", "-R", "u=rwX,g=rX,o=rX", dst], check=True, timeout=60)
-                self.logger.log("✅ Permissions set")
+                # u=rwX,g=rX,o=rX was applied as each entry was written; only rsync's entries remain
+                for rel, _ in fallback: self._apply_mode(os.path.join(dst, rel))
+                for rel in unscanned:
+                    for root, dirs, files in os.walk(os.path.join(dst, rel)):
+                        for name in dirs + files: self._apply_mode(os.path.join(root, name))
+                self.logger.log("\n✅ TRANSFER COMPLETE")
                 
                 # Verify
                 self.logger.log("\n🔍 VERIFYING...")
-                hidden_count = 0
-                for root, dirs, files in os.walk(dst):
-                    dirs[:] = [d for d in dirs if d not in EXCLUSION_SET]
-                    for f in files:
-                        if f.startswith('.') and f not in EXCLUSION_SET: hidden_count += 1
-                self.logger.log(f"Hidden in dest: {hidden_count:,} (source: {len(scan_data['hidden_files']):,})")
+                # Hidden files: lstat the scanned paths in dst instead of walking the tree again
+                hidden = scan_data['hidden_files']
+                with ThreadPoolExecutor(max_workers=VERIFY_WORKERS) as pool:
+                    present = sum(sz is not None for sz in pool.map(lambda rel: self._safe_stat(os.path.join(dst, rel)), hidden))
+                self.logger.log(f"Hidden in dest: {present:,}/{len(hidden):,} present")
+                if present < len(hidden): self.logger.log(f"Hidden missing: {len(hidden) - present:,}", 'warning')
                 
                 # Verify samples
                 verified = 0
-                for rel, expected_sz in scan_data['samples']:
-                    dst_file = os.path.join(dst, rel)
-                    if os.path.exists(dst_file):
-                        actual_sz = os.path.getsize(dst_file)
-                        if actual_sz == expected_sz: verified += 1
-                        else: self.logger.log(f"Size mismatch: {rel}", 'warning')
+                with ThreadPoolExecutor(max_workers=VERIFY_WORKERS) as pool:
+                    results = list(pool.map(lambda t: (t[0], t[1], self._safe_stat(os.path.join(dst, t[0]))),
+                                            scan_data['samples']))
+                for rel, expected_sz, actual_sz in results:
+                    if actual_sz is None: continue
+                    if actual_sz == expected_sz: verified += 1
+                    else: self.logger.log(f"Size mismatch: {rel}", 'warning')
                 self.logger.log(f"Samples verified: {verified}/{len(scan_data['samples'])}")
                 
+                # Inode delta: cheap count of entries created, in place of walking dst again
+                inodes_after = self._inodes_used(dst)
+                if inodes_before is not None and inodes_after is not None:
+                    expected = scan_data['files'] + scan_data['dirs'] + fresh
+                    delta = inodes_after - inodes_before
+                    self.logger.log(f"Inodes created: {delta:,} (scanned entries: {expected:,})")
+                    if fresh and delta < expected:
+                        self.logger.log(f"Inode delta {expected - delta:,} short of scan", 'warning')
+                
                 success = True
                 
             except Exception as e:
@@ -511,9 +1143,9 @@ class ForensicCopyGUI:
                     time.sleep(RETRY_DELAY_SECONDS)
         
         # Finalize
-        self.state.set('copy_in_progress', False)
+        self.state.copy_in_progress.clear()
         if success:
-            self.state.set('copy_completed', True)
+            self.state.copy_completed.set()
             self.root.after(0, lambda: self._finish(True, dst))
         else:
             self.state.set('copy_failed', True)
@@ -521,11 +1153,14 @@ class ForensicCopyGUI:
     
     def _cancel_copy(self):
         self.logger.log("\n CANCEL REQUESTED")
-        self.state.set('cancel_requested', True)
+        self.state.cancel_requested.set()
+        with self._procs_lock:
+            for proc in self._procs:
+                try: proc.terminate()
+                except: pass
         self.status_var.set("Status: Cancelling...")
     
     def _finish(self, success, info):
-        self.progress.stop()
         self.progress.grid_remove()
         self.progress_label.grid_remove()
         self.btn_cancel.grid_remove()
@@ -534,6 +1169,9 @@ class ForensicCopyGUI:
         self.state.reset()
         
         duration = time.time() - getattr(self, '_copy_start', time.time())
+        lg = self.logger
+        lg.log(f"LOG: {len(lg.entries):,} entries in memory | {lg.entries_dropped:,} trimmed | "
+               f"{lg.dropped:,} not shown in GUI (all kept in log file)")
         
         if success:
             self.logger.log(f"\n{'='*100}")
@@ -549,10 +1187,11 @@ class ForensicCopyGUI:
             self.status_var.set("Failed")
             messagebox.showerror("FAILED", f" Error:\n\n{info}")
         
-        self.logger.close()
+        # Flush, not close: the session (and any further copy) keeps logging to the same file
+        self.logger.flush()
     
     def _on_close(self):
-        if self.state.get('copy_in_progress'):
+        if self.state.copy_in_progress.is_set():
             if not messagebox.askyesno("In Progress", "Copy running. Force quit?"):
                 return
             self._cancel_copy()